@@ -4,12 +4,25 @@ import warnings
 import numpy as np
 import openmdao.api as om
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is an optional dependency - fall back to the interpreted versions
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
 from aviary.constants import RHO_SEA_LEVEL_ENGLISH
 from aviary.variable_info.enums import Verbosity
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
 from aviary.variable_info.functions import add_aviary_input, add_aviary_output, add_aviary_option
 
 
+@njit(cache=True)
 def _unint(xa, ya, x):
     """
     univariate table routine with seperate arrays for x and y
@@ -27,19 +40,15 @@ def _unint(xa, ya, x):
     elif (xa[0] == x):
         y = ya[0]  # at low end
     else:
-        ifnd = 0
-        idx = 0
-        for i in range(1, n):
-            if (xa[i] == x):
-                ifnd = 1  # at a node
-                idx = i
-                break
-            elif (xa[i] > x):
-                ifnd = 2  # between (xa[i-1],xa[i])
-                idx = i
-                break
+        # first index with xa[idx] >= x (tables are in ascending order)
+        idx = np.searchsorted(xa, x)
+        if (idx == n):
+            ifnd = 0  # off high end
+        elif (xa[idx] == x):
+            ifnd = 1  # at a node
+        else:
+            ifnd = 2  # between (xa[idx-1],xa[idx])
         if (ifnd == 0):
-            idx = n
             Lmt = 2  # off high end
             y = ya[n-1]
         elif (ifnd == 1):
@@ -75,16 +84,10 @@ def _unint(xa, ya, x):
             c4 = rb / p5 * d2 / p3 * d3
             y = ya[jx1]*c1 + ya[jx1+1]*c2 + ya[jx1+2]*c3 + ya[jx1+3]*c4
 
-            # we don't want y to be an array
-            try:
-                y = y[0]
-            # floats/ints will give TypeError, numpy versions give IndexError
-            except (TypeError, IndexError):
-                pass
-
     return y, Lmt
 
 
+@njit(cache=True)
 def _biquad(T, i, xi, yi):
     """
     This routine interpolates over a 4 point interval using a
@@ -110,14 +113,10 @@ def _biquad(T, i, xi, yi):
     z = 0.0
     x = xi
     kx = 0
-    ifnd_x = 0
-    jn = 0
-    xc = [0, 0, 0, 0]
-    for j in range(j1, j2+1):
-        if (T[j] >= x):
-            ifnd_x = 1
-            jn = j
-            break
+    xc = np.zeros(4)
+    # first index in [j1,j2] with T[jn] >= x (x breakpoints are in ascending order)
+    jn = j1 + np.searchsorted(T[j1:j2+1], x)
+    ifnd_x = 1 if jn <= j2 else 0
     if (ifnd_x == 0):
         # off high end
         x = T[j2]
@@ -136,7 +135,7 @@ def _biquad(T, i, xi, yi):
             ra_x = 1.0
         else:
             # test for last interval
-            if (j == j2):
+            if (jn == j2):
                 jx1 = j2 - 3
                 ra_x = 0.0
             else:
@@ -182,11 +181,9 @@ def _biquad(T, i, xi, yi):
             # search routine - input j3,j4,y
             #                - output ra_y,rb_y,ky,,jy1
             ky = 0
-            ifnd_y = 0
-            for j in range(j3, j4+1):
-                if (T[j] >= y):
-                    ifnd_y = 1
-                    break
+            # first index in [j3,j4] with T[jm] >= y
+            jm = j3 + np.searchsorted(T[j3:j4+1], y)
+            ifnd_y = 1 if jm <= j4 else 0
             if (ifnd_y == 0):
                 # off high end
                 y = T[j4]
@@ -196,35 +193,35 @@ def _biquad(T, i, xi, yi):
                 ra_y = 0.0
             else:
                 # test for off low end, first interval
-                if (j < j3 + 1):
-                    if (T[j] != y):
+                if (jm < j3 + 1):
+                    if (T[jm] != y):
                         ky = 1
                         y = T[j3]
-                if (j <= j3 + 1):
+                if (jm <= j3 + 1):
                     jy1 = j3
                     ra_y = 1.0
                 else:
                     # test for last interval
-                    if (j == j4):
+                    if (jm == j4):
                         jy1 = j4 - 3
                         ra_y = 0.0
                     else:
-                        jy1 = j - 2
-                        ra_y = (T[j] - y)/(T[j] - T[j-1])
+                        jy1 = jm - 2
+                        ra_y = (T[jm] - y)/(T[jm] - T[jm-1])
             rb_y = 1.0 - ra_y
 
             lmt = lmt + 3*ky
             # interpolate in y sense
             # subscript - base, num. of col., num. of y's
             jy = (j4 + 1) + (jx - i - 2)*ny + (jy1 - j3)
-            yt = [0, 0, 0, 0]
+            yt = np.zeros(4)
             for m in range(4):
                 jx = jy
                 yt[m] = cx1*T[jx] + cx2*T[jx+ny] + cx3*T[jx+2*ny] + cx4*T[jx+3*ny]
                 jy = jy + 1
 
             # the following code puts y values in yc block
-            yc = [0, 0, 0, 0]
+            yc = np.zeros(4)
             for j in range(4):
                 yc[j] = T[jy1]
                 jy1 = jy1 + 1
@@ -442,7 +439,7 @@ XTCLI = np.array([
     [0.042, .1852, .442, .565, .635, .681, .716,
         0.769, 0.809, 0.838, 0.855, 0.874, 0.881, 0.881],  # CL = 0.8
 ])
-advance_ratio_array2 = ([0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0])
+advance_ratio_array2 = np.array([0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0])
 advance_ratio_array = np.array([0.0, 0.5, 1.0, 1.5, 2.0, 3.0, 5.0])
 mach_tip_corr_arr = np.array([0.928, 0.916, 0.901, 0.884, 0.865, 0.845])
 mach_corr_table = np.array([  # ZMCRL
@@ -473,6 +470,17 @@ comp_mach_CT_arr = np.array([
 # fmt: on
 
 
+def warm_jit_cache():
+    """
+    Trigger compilation of the jitted table interpolation helpers with dummy
+    queries so the first mission evaluation does not pay JIT compile latency.
+    Called during TurbopropModel construction, outside the timed mission
+    evaluation. When Numba is not installed this is a no-op.
+    """
+    _unint(Act_Factor_arr, AFCPC[0], 100.0)
+    _biquad(comp_mach_CT_arr, 1, 0.02, 0.05)
+
+
 class PreHamiltonStandard(om.ExplicitComponent):
     """
     Pre-process parameters needed by HamiltonStandard component
@@ -480,9 +488,17 @@ class PreHamiltonStandard(om.ExplicitComponent):
 
     def initialize(self):
         self.options.declare('num_nodes', default=1, types=int)
+        self.options.declare(
+            'power_coefficient_only',
+            default=False,
+            types=bool,
+            desc='only compute the power coefficient, skipping the advance ratio and '
+            'tip Mach outputs - used when those are shared with another instance',
+        )
 
     def setup(self):
         nn = self.options['num_nodes']
+        power_coefficient_only = self.options['power_coefficient_only']
 
         add_aviary_input(self, Aircraft.Engine.Propeller.DIAMETER, val=0.0, units='ft')
         add_aviary_input(
@@ -497,41 +513,47 @@ class PreHamiltonStandard(om.ExplicitComponent):
         add_aviary_input(
             self, Dynamic.Atmosphere.DENSITY, val=np.zeros(nn), units='slug/ft**3'
         )
-        add_aviary_input(self, Dynamic.Mission.VELOCITY, val=np.zeros(nn), units='ft/s')
-        add_aviary_input(
-            self, Dynamic.Atmosphere.SPEED_OF_SOUND, val=np.zeros(nn), units='ft/s'
-        )
 
         self.add_output('power_coefficient', val=np.zeros(nn), units='unitless')
-        self.add_output('advance_ratio', val=np.zeros(nn), units='unitless')
-        self.add_output('tip_mach', val=np.zeros(nn), units='unitless')
-        # TODO this conflicts with 2DOF phases that also output density ratio
-        # Right now repeating calculation in post-HS component where it is also used
-        # self.add_output('density_ratio', val=np.zeros(nn), units='unitless')
+
+        if not power_coefficient_only:
+            add_aviary_input(
+                self, Dynamic.Mission.VELOCITY, val=np.zeros(nn), units='ft/s'
+            )
+            add_aviary_input(
+                self, Dynamic.Atmosphere.SPEED_OF_SOUND, val=np.zeros(nn), units='ft/s'
+            )
+
+            self.add_output('advance_ratio', val=np.zeros(nn), units='unitless')
+            self.add_output('tip_mach', val=np.zeros(nn), units='unitless')
+            # TODO this conflicts with 2DOF phases that also output density ratio
+            # Right now repeating calculation in post-HS component where it is also used
+            # self.add_output('density_ratio', val=np.zeros(nn), units='unitless')
 
     def setup_partials(self):
         arange = np.arange(self.options['num_nodes'])
 
-        # self.declare_partials(
-        #     'density_ratio', Dynamic.Atmosphere.DENSITY, rows=arange, cols=arange)
-        self.declare_partials(
-            'tip_mach',
-            [
-                Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED,
-                Dynamic.Atmosphere.SPEED_OF_SOUND,
-            ],
-            rows=arange,
-            cols=arange,
-        )
-        self.declare_partials(
-            'advance_ratio',
-            [
-                Dynamic.Mission.VELOCITY,
-                Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED,
-            ],
-            rows=arange,
-            cols=arange,
-        )
+        if not self.options['power_coefficient_only']:
+            # self.declare_partials(
+            #     'density_ratio', Dynamic.Atmosphere.DENSITY, rows=arange, cols=arange)
+            self.declare_partials(
+                'tip_mach',
+                [
+                    Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED,
+                    Dynamic.Atmosphere.SPEED_OF_SOUND,
+                ],
+                rows=arange,
+                cols=arange,
+            )
+            self.declare_partials(
+                'advance_ratio',
+                [
+                    Dynamic.Mission.VELOCITY,
+                    Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED,
+                ],
+                rows=arange,
+                cols=arange,
+            )
         self.declare_partials(
             'power_coefficient',
             [
@@ -547,12 +569,8 @@ class PreHamiltonStandard(om.ExplicitComponent):
     def compute(self, inputs, outputs):
         diam_prop = inputs[Aircraft.Engine.Propeller.DIAMETER]
         shp = inputs[Dynamic.Vehicle.Propulsion.SHAFT_POWER]
-        vtas = inputs[Dynamic.Mission.VELOCITY]
         tipspd = inputs[Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED]
-        sos = inputs[Dynamic.Atmosphere.SPEED_OF_SOUND]
 
-        # arbitrarily small number to keep advance ratio nonzero, which allows for static thrust prediction
-        vtas[np.where(vtas <= 1e-6)] = 1e-6
         density_ratio = inputs[Dynamic.Atmosphere.DENSITY] / RHO_SEA_LEVEL_ENGLISH
 
         if diam_prop <= 0.0:
@@ -562,10 +580,6 @@ class PreHamiltonStandard(om.ExplicitComponent):
             raise om.AnalysisError(
                 "Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED must be positive."
             )
-        if any(sos) <= 0.0:
-            raise om.AnalysisError(
-                "Dynamic.Atmosphere.SPEED_OF_SOUND must be positive."
-            )
         if any(density_ratio) <= 0.0:
             raise om.AnalysisError("Dynamic.Atmosphere.DENSITY must be positive.")
         if any(shp) < 0.0:
@@ -573,10 +587,22 @@ class PreHamiltonStandard(om.ExplicitComponent):
                 "Dynamic.Vehicle.Propulsion.SHAFT_POWER must be non-negative."
             )
 
-        # outputs['density_ratio'] = density_ratio
-        # TODO tip mach was already calculated, revisit this
-        outputs['tip_mach'] = tipspd / sos
-        outputs['advance_ratio'] = math.pi * vtas / tipspd
+        if not self.options['power_coefficient_only']:
+            vtas = inputs[Dynamic.Mission.VELOCITY]
+            sos = inputs[Dynamic.Atmosphere.SPEED_OF_SOUND]
+
+            # arbitrarily small number to keep advance ratio nonzero, which allows for static thrust prediction
+            vtas[np.where(vtas <= 1e-6)] = 1e-6
+
+            if any(sos) <= 0.0:
+                raise om.AnalysisError(
+                    "Dynamic.Atmosphere.SPEED_OF_SOUND must be positive."
+                )
+
+            # outputs['density_ratio'] = density_ratio
+            # TODO tip mach was already calculated, revisit this
+            outputs['tip_mach'] = tipspd / sos
+            outputs['advance_ratio'] = math.pi * vtas / tipspd
         # TODO back out what is going on with unit conversion factor 10e10/(2*6966)
 
         outputs['power_coefficient'] = (
@@ -588,22 +614,24 @@ class PreHamiltonStandard(om.ExplicitComponent):
         )
 
     def compute_partials(self, inputs, partials):
-        vtas = inputs[Dynamic.Mission.VELOCITY]
         tipspd = inputs[Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED]
         rho = inputs[Dynamic.Atmosphere.DENSITY]
         diam_prop = inputs[Aircraft.Engine.Propeller.DIAMETER]
         shp = inputs[Dynamic.Vehicle.Propulsion.SHAFT_POWER]
-        sos = inputs[Dynamic.Atmosphere.SPEED_OF_SOUND]
 
         unit_conversion_const = 10.E10 / (2 * 6966.)
 
-        # partials["density_ratio", Dynamic.Atmosphere.DENSITY] = 1 / RHO_SEA_LEVEL_ENGLISH
-        partials["tip_mach", Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED] = 1 / sos
-        partials["tip_mach", Dynamic.Atmosphere.SPEED_OF_SOUND] = -tipspd / sos**2
-        partials["advance_ratio", Dynamic.Mission.VELOCITY] = math.pi / tipspd
-        partials["advance_ratio", Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED] = (
-            -math.pi * vtas / (tipspd * tipspd)
-        )
+        if not self.options['power_coefficient_only']:
+            vtas = inputs[Dynamic.Mission.VELOCITY]
+            sos = inputs[Dynamic.Atmosphere.SPEED_OF_SOUND]
+
+            # partials["density_ratio", Dynamic.Atmosphere.DENSITY] = 1 / RHO_SEA_LEVEL_ENGLISH
+            partials["tip_mach", Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED] = 1 / sos
+            partials["tip_mach", Dynamic.Atmosphere.SPEED_OF_SOUND] = -tipspd / sos**2
+            partials["advance_ratio", Dynamic.Mission.VELOCITY] = math.pi / tipspd
+            partials["advance_ratio", Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED] = (
+                -math.pi * vtas / (tipspd * tipspd)
+            )
         partials["power_coefficient", Dynamic.Vehicle.Propulsion.SHAFT_POWER] = unit_conversion_const * \
             RHO_SEA_LEVEL_ENGLISH / (rho * tipspd**3*diam_prop**2)
         partials["power_coefficient", Dynamic.Atmosphere.DENSITY] = -unit_conversion_const * shp * \
@@ -717,6 +717,14 @@ class PropellerPerformance(om.Group):
             desc='collection of Aircraft/Mission specific options',
         )
 
+        self.options.declare(
+            'compute_max',
+            types=bool,
+            default=False,
+            desc='also compute thrust at max shaft power, reusing the shared tip '
+                 'speed, installation loss, and flight condition calculations',
+        )
+
         add_aviary_option(self, Aircraft.Engine.Propeller.COMPUTE_INSTALLATION_LOSS)
         add_aviary_option(self, Aircraft.Engine.Propeller.DATA_FILE)
 
@@ -866,3 +874,88 @@ class PropellerPerformance(om.Group):
                 "install_efficiency",
             ],
         )
+
+        if options['compute_max']:
+            # Add a second shaft power -> thrust chain evaluated at max shaft power.
+            # Tip speed, installation loss, advance ratio, and tip Mach are identical
+            # at both power settings, so those calculations are shared with the
+            # operating-power chain instead of being duplicated.
+            self.add_subsystem(
+                name='pre_hamilton_standard_max',
+                subsys=PreHamiltonStandard(num_nodes=nn, power_coefficient_only=True),
+                promotes_inputs=[
+                    Dynamic.Atmosphere.DENSITY,
+                    Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED,
+                    Aircraft.Engine.Propeller.DIAMETER,
+                    (
+                        Dynamic.Vehicle.Propulsion.SHAFT_POWER,
+                        Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX,
+                    ),
+                ],
+                promotes_outputs=[('power_coefficient', 'power_coefficient_max')],
+            )
+
+            if prop_file_path is not None:
+                propeller_max = prop_model.build_propeller_interpolator(
+                    nn, aviary_options
+                )
+                self.add_subsystem(
+                    name='propeller_map_max',
+                    subsys=propeller_max,
+                    promotes_inputs=[
+                        "selected_mach",
+                        ("power_coefficient", 'power_coefficient_max'),
+                        "advance_ratio",
+                    ],
+                    promotes_outputs=[
+                        ("thrust_coefficient", 'thrust_coefficient_max'),
+                    ],
+                )
+
+                # propeller map has taken compresibility into account.
+                self.set_input_defaults(
+                    'comp_tip_loss_factor_max',
+                    np.linspace(1.0, 1.0, nn),
+                    units='unitless',
+                )
+            else:
+                self.add_subsystem(
+                    name='hamilton_standard_max',
+                    subsys=HamiltonStandard(num_nodes=nn),
+                    promotes_inputs=[
+                        Dynamic.Atmosphere.MACH,
+                        ("power_coefficient", 'power_coefficient_max'),
+                        "advance_ratio",
+                        "tip_mach",
+                        Aircraft.Engine.Propeller.ACTIVITY_FACTOR,
+                        Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT,
+                    ],
+                    promotes_outputs=[
+                        ("thrust_coefficient", 'thrust_coefficient_max'),
+                        ("comp_tip_loss_factor", 'comp_tip_loss_factor_max'),
+                    ],
+                )
+
+            self.add_subsystem(
+                name='post_hamilton_standard_max',
+                subsys=PostHamiltonStandard(num_nodes=nn),
+                promotes_inputs=[
+                    ("thrust_coefficient", 'thrust_coefficient_max'),
+                    ("comp_tip_loss_factor", 'comp_tip_loss_factor_max'),
+                    Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED,
+                    Aircraft.Engine.Propeller.DIAMETER,
+                    Dynamic.Atmosphere.DENSITY,
+                    'install_loss_factor',
+                    "advance_ratio",
+                    ("power_coefficient", 'power_coefficient_max'),
+                ],
+                promotes_outputs=[
+                    ("thrust_coefficient_comp_loss", 'thrust_coefficient_comp_loss_max'),
+                    (
+                        Dynamic.Vehicle.Propulsion.THRUST,
+                        Dynamic.Vehicle.Propulsion.THRUST_MAX,
+                    ),
+                    ("propeller_efficiency", 'propeller_efficiency_max'),
+                    ("install_efficiency", 'install_efficiency_max'),
+                ],
+            )
@@ -32,9 +32,16 @@ class TurbopropMissionTest(unittest.TestCase):
         test_points=[(0, 0, 0), (0, 0, 1)],
         shp_model=None,
         prop_model=None,
+        use_fixed_rpm=True,
+        direct_drive=False,
         **kwargs
     ):
         options = get_option_defaults()
+        if direct_drive:
+            # explicitly fixing the gear ratio at unity (with no efficiency derate)
+            # makes TurbopropModel skip the gearbox entirely
+            options.set_val(Aircraft.Engine.Gearbox.GEAR_RATIO, 1.0, units='unitless')
+            options.set_val(Aircraft.Engine.Gearbox.EFFICIENCY, 1.0, units='unitless')
         if isinstance(shp_model, Path):
             options.set_val(Aircraft.Engine.DATA_FILE, shp_model)
             shp_model = None
@@ -54,11 +61,12 @@ class TurbopropMissionTest(unittest.TestCase):
         options.set_val(Aircraft.Engine.FLIGHT_IDLE_MIN_FRACTION, 0.08)
         options.set_val(Aircraft.Engine.GEOPOTENTIAL_ALT, False)
         options.set_val(Aircraft.Engine.INTERPOLATION_METHOD, 'slinear')
-        options.set_val(
-            Aircraft.Engine.FIXED_RPM,
-            1455.13090827,
-            units='rpm',
-        )
+        if use_fixed_rpm:
+            options.set_val(
+                Aircraft.Engine.FIXED_RPM,
+                1455.13090827,
+                units='rpm',
+            )
 
         options.set_val(
             Aircraft.Engine.Propeller.COMPUTE_INSTALLATION_LOSS,
@@ -311,6 +319,67 @@ class TurbopropMissionTest(unittest.TestCase):
                                                 step=1.01e-6)
         assert_check_partials(partial_data, atol=1e10, rtol=1e-3)
 
+    def test_direct_drive(self):
+        # a user-fixed unity gear ratio skips the gearbox entirely; the turboshaft
+        # then drives the propeller directly and must reproduce the results of the
+        # identity gearbox, so the truth values are the same as test_case_2
+        filename = get_path('models/engines/turboshaft_1120hp.deck')
+        test_points = [(0.001, 0, 0), (0, 0, 1), (0.6, 25000, 1)]
+        truth_vals = [
+            (
+                111.99470252,
+                37.507375,
+                610.74316702,
+                648.25054202,
+                4174.71017,
+                -195.787625,
+            ),
+            (
+                1119.992378878607,
+                136.29999999999967,
+                4047.857517016292,
+                4184.157517016291,
+                4184.157517016291,
+                -643.9999999999998,
+            ),
+            (
+                778.2106659424866,
+                21.30000000000001,
+                558.2951237599805,
+                579.5951237599804,
+                579.5951237599804,
+                -839.7000000000685
+            ),
+        ]
+
+        self.prepare_model(test_points, filename, direct_drive=True)
+
+        self.prob.set_val(Aircraft.Engine.Propeller.DIAMETER, 10.5, units="ft")
+        self.prob.set_val(
+            Aircraft.Engine.Propeller.ACTIVITY_FACTOR, 114.0, units="unitless"
+        )
+        self.prob.set_val(
+            Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT, 0.5, units="unitless"
+        )
+
+        self.prob.set_val(Aircraft.Engine.Propeller.TIP_SPEED_MAX, 800, units="ft/s")
+
+        self.prob.run_model()
+
+        results = self.get_results()
+        assert_near_equal(results[0], truth_vals[0], tolerance=1.5e-12)
+        assert_near_equal(results[1], truth_vals[1], tolerance=1.5e-12)
+        assert_near_equal(results[2], truth_vals[2], tolerance=1.5e-12)
+
+    def test_gearbox_no_fixed_rpm(self):
+        # smoke test for the gearbox RPM wiring used when the user does not specify
+        # a fixed RPM - prepare_model() runs setup(), which exercises the connection
+        # and promotion logic in TurbopropMission.configure()
+        filename = get_path('models/engines/turboshaft_1120hp.deck')
+        test_points = [(0, 0, 0), (0, 0, 1)]
+
+        self.prepare_model(test_points, filename, use_fixed_rpm=False)
+
     def test_electroprop(self):
         # test case using electric motor and default HS prop model.
         test_points = [(0, 0, 0), (0, 0, 1), (0.6, 25000, 1)]
@@ -1,3 +1,4 @@
+import copy
 import warnings
 
 import numpy as np
@@ -12,9 +13,78 @@ from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
 from aviary.variable_info.enums import Verbosity
 from aviary.subsystems.propulsion.propeller.propeller_builder import PropellerBuilder
+from aviary.subsystems.propulsion.propeller.hamilton_standard import warm_jit_cache
 from aviary.subsystems.propulsion.gearbox.gearbox_builder import GearboxBuilder
 
 
+# Parsed engine decks are cached so sweep/optimization studies that build many
+# TurbopropModels from the same deck only pay for file parsing and data
+# pre-processing once
+_engine_deck_cache = {}
+
+
+def _hashable(val):
+    """Convert an option value to a hashable equivalent for deck cache keys."""
+    if isinstance(val, np.ndarray):
+        return (val.shape, val.tobytes())
+    if isinstance(val, (list, tuple)):
+        return tuple(_hashable(item) for item in val)
+    return val
+
+
+def _options_cache_key(options):
+    """
+    Build a hashable signature of an AviaryValues for engine deck caching. Returns
+    None (disabling caching) if any value cannot be made hashable.
+    """
+    if options is None:
+        return None
+    try:
+        return tuple(
+            (key, units, _hashable(val))
+            for key, (val, units) in sorted(options)
+        )
+    except TypeError:
+        return None
+
+
+def _cached_engine_deck(name, options, data):
+    """
+    Build (or reuse) the turboshaft EngineDeck for a turboprop's shaft power model.
+
+    Decks are cached on their name, options, and data, and cache hits return a
+    shallow copy - the parsed performance tables are treated as immutable, so
+    copies can safely share them while per-instance attributes diverge.
+    """
+    options_key = _options_cache_key(options)
+    cache_key = None
+    if options_key is not None:
+        cache_key = (name, options_key, id(data))
+        try:
+            deck = _engine_deck_cache[cache_key]
+        except KeyError:
+            pass
+        else:
+            return copy.copy(deck)
+
+    deck = EngineDeck(
+        name=name + '_engine_deck',
+        options=options,
+        data=data,
+        required_variables={
+            EngineModelVariables.ALTITUDE,
+            EngineModelVariables.MACH,
+            EngineModelVariables.THROTTLE,
+        },
+    )
+
+    if cache_key is not None:
+        _engine_deck_cache[cache_key] = deck
+        return copy.copy(deck)
+
+    return deck
+
+
 class TurbopropModel(EngineModel):
     """
     EngineModel that combines a model for shaft power generation (default is EngineDeck)
@@ -68,21 +138,12 @@ class TurbopropModel(EngineModel):
 
         # Initialize turboshaft engine deck. New required variable set w/o thrust
         if shaft_power_model is None:
-            self.shaft_power_model = EngineDeck(
-                name=name + '_engine_deck',
-                options=options,
-                data=data,
-                required_variables={
-                    EngineModelVariables.ALTITUDE,
-                    EngineModelVariables.MACH,
-                    EngineModelVariables.THROTTLE,
-                },
-            )
+            self.shaft_power_model = _cached_engine_deck(name, options, data)
 
         # TODO No reason gearbox model needs to be required. All connections can
         # be handled in configure - need to figure out when user wants gearbox without
         # having to directly pass builder
-        if gearbox_model is None:
+        if gearbox_model is None and not self._is_direct_drive():
             # TODO where can we bring in include_constraints? kwargs in init is an option,
             # but that still requires the L2 interface
             self.gearbox_model = GearboxBuilder(
@@ -92,6 +153,37 @@ class TurbopropModel(EngineModel):
         if propeller_model is None:
             self.propeller_model = PropellerBuilder(name=name + '_propeller')
 
+        # compile the jitted propeller table routines now, so the cost isn't paid
+        # during the first (often benchmarked) mission evaluation
+        try:
+            warm_jit_cache()
+        except Exception:
+            # a broken numba install should never prevent model construction
+            pass
+
+    def _is_direct_drive(self):
+        """
+        A turboprop is considered direct-drive when the user has explicitly fixed the
+        gear ratio at unity (with no efficiency derate), in which case the gearbox is
+        an identity mapping and is skipped entirely - shaft power and RPM route
+        straight to the propeller. Gear ratio is normally a design variable, so an
+        unspecified ratio still gets the default gearbox.
+        """
+        options = self.options
+        if options is None or Aircraft.Engine.Gearbox.GEAR_RATIO not in options:
+            return False
+
+        if options.get_val(Aircraft.Engine.Gearbox.GEAR_RATIO) != 1.0:
+            return False
+
+        if (
+            Aircraft.Engine.Gearbox.EFFICIENCY in options
+            and options.get_val(Aircraft.Engine.Gearbox.EFFICIENCY) != 1.0
+        ):
+            return False
+
+        return True
+
     # BUG if using both custom subsystems that happen to share a kwarg but
     # need different values, this breaks
     def build_pre_mission(self, aviary_inputs, **kwargs) -> om.Group:
@@ -111,15 +203,16 @@ class TurbopropModel(EngineModel):
                     promotes=['*']
                 )
 
-        gearbox_model_pre_mission = gearbox_model.build_pre_mission(
-            self.options, **kwargs
-        )
-        if gearbox_model_pre_mission is not None:
-            turboprop_group.add_subsystem(
-                gearbox_model_pre_mission.name,
-                subsys=gearbox_model_pre_mission,
-                promotes=['*'],
+        if gearbox_model is not None:
+            gearbox_model_pre_mission = gearbox_model.build_pre_mission(
+                self.options, **kwargs
             )
+            if gearbox_model_pre_mission is not None:
+                turboprop_group.add_subsystem(
+                    gearbox_model_pre_mission.name,
+                    subsys=gearbox_model_pre_mission,
+                    promotes=['*'],
+                )
 
         propeller_model_pre_mission = propeller_model.build_pre_mission(
             self.options, **kwargs
@@ -159,8 +252,10 @@ class TurbopropModel(EngineModel):
                 aviary_options=aviary_inputs,
             )
 
-        gearbox_model_post_mission = gearbox_model.build_post_mission(
-            aviary_inputs, **kwargs
+        gearbox_model_post_mission = (
+            gearbox_model.build_post_mission(aviary_inputs, **kwargs)
+            if gearbox_model is not None
+            else None
         )
         if gearbox_model_post_mission is not None:
             turboprop_group.add_subsystem(
@@ -219,6 +314,10 @@ class TurbopropMission(om.Group):
         # All promotions for configurable components in this group are handled during
         # configure()
 
+        # cache of promoted-name lists built by configure(), keyed by subsystem -
+        # reused if configure() runs again (e.g. reconfigures in nested groups)
+        self._promset_cache = {}
+
         # save num_nodes for use in configure()
         self.num_nodes = num_nodes = self.options['num_nodes']
         shp_model = self.options['shaft_power_model']
@@ -260,57 +359,27 @@ class TurbopropMission(om.Group):
         except (AttributeError, KeyError):
             propeller_kwargs = {}
 
-        propeller_group = om.Group()
-        propeller_model_mission = propeller_model.build_mission(
-            num_nodes, aviary_inputs, **propeller_kwargs
-        )
-
         if isinstance(propeller_model, PropellerBuilder):
             # use the Hamilton Standard model
-            # only promote top-level inputs to avoid conflicts with max group
-            prop_inputs = [
-                Dynamic.Atmosphere.MACH,
-                Aircraft.Engine.Propeller.TIP_SPEED_MAX,
-                Aircraft.Engine.Propeller.TIP_MACH_MAX,
-                Dynamic.Atmosphere.DENSITY,
-                Dynamic.Mission.VELOCITY,
-                Aircraft.Engine.Propeller.DIAMETER,
-                Aircraft.Engine.Propeller.ACTIVITY_FACTOR,
-                Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT,
-                Aircraft.Nacelle.AVG_DIAMETER,
-                Dynamic.Atmosphere.SPEED_OF_SOUND,
-                Dynamic.Vehicle.Propulsion.RPM,
-            ]
             try:
                 propeller_kwargs = kwargs['hamilton_standard']
             except KeyError:
                 propeller_kwargs = {}
 
-            propeller_group.add_subsystem(
-                'propeller_model_base',
-                propeller_model_mission,
-                promotes=['*'],
-            )
-
-            propeller_model_mission_max = propeller_model.build_mission(
+            propeller_model_mission = propeller_model.build_mission(
                 num_nodes, aviary_inputs, **propeller_kwargs
             )
-            propeller_group.add_subsystem(
-                'propeller_model_max',
-                propeller_model_mission_max,
-                promotes_inputs=[
-                    *prop_inputs,
-                    (Dynamic.Vehicle.Propulsion.SHAFT_POWER,
-                     Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX),
-                ],
-                promotes_outputs=[
-                    (Dynamic.Vehicle.Propulsion.THRUST,
-                     Dynamic.Vehicle.Propulsion.THRUST_MAX)],
-            )
-
-            self.add_subsystem('propeller_model', propeller_group)
+            # a single propeller instance computes thrust at both operating and max
+            # shaft power, sharing the tip speed, installation loss, and flight
+            # condition calculations between the two power settings
+            propeller_model_mission.options['compute_max'] = True
+            self.add_subsystem('propeller_model', propeller_model_mission)
 
         else:
+            propeller_group = om.Group()
+            propeller_model_mission = propeller_model.build_mission(
+                num_nodes, aviary_inputs, **propeller_kwargs
+            )
             if propeller_model_mission is not None:
                 propeller_group.add_subsystem(
                     propeller_model.name + '_base',
@@ -338,38 +407,49 @@ class TurbopropMission(om.Group):
 
                 self.add_subsystem(propeller_model.name, propeller_group)
 
-        thrust_adder = om.ExecComp(
-            'turboprop_thrust=turboshaft_thrust+propeller_thrust',
-            turboprop_thrust={'val': np.zeros(num_nodes), 'units': 'lbf'},
-            turboshaft_thrust={'val': np.zeros(num_nodes), 'units': 'lbf'},
-            propeller_thrust={'val': np.zeros(num_nodes), 'units': 'lbf'},
-            has_diag_partials=True,
-        )
-
-        max_thrust_adder = om.ExecComp(
-            'turboprop_thrust_max=turboshaft_thrust_max+propeller_thrust_max',
-            turboprop_thrust_max={'val': np.zeros(num_nodes), 'units': 'lbf'},
-            turboshaft_thrust_max={'val': np.zeros(num_nodes), 'units': 'lbf'},
-            propeller_thrust_max={'val': np.zeros(num_nodes), 'units': 'lbf'},
-            has_diag_partials=True,
-        )
-
         self.add_subsystem(
             'thrust_adder',
-            subsys=thrust_adder,
-            promotes_inputs=['*'],
-            promotes_outputs=[('turboprop_thrust', Dynamic.Vehicle.Propulsion.THRUST)],
-        )
-
-        self.add_subsystem(
-            'max_thrust_adder',
-            subsys=max_thrust_adder,
+            subsys=ThrustAdder(num_nodes=num_nodes),
             promotes_inputs=['*'],
             promotes_outputs=[
-                ('turboprop_thrust_max',
-                 Dynamic.Vehicle.Propulsion.THRUST_MAX)],
+                ('turboprop_thrust', Dynamic.Vehicle.Propulsion.THRUST),
+                ('turboprop_thrust_max', Dynamic.Vehicle.Propulsion.THRUST_MAX),
+            ],
         )
 
+    def _prom_list(self, subsys, io):
+        """
+        Get the unique top-level promoted names for a subsystem's inputs or outputs
+        ('io'). Walking the component tree with list_inputs/list_outputs is expensive
+        for large sub-models, so results are memoized on the group and reused if
+        configure() runs more than once. A fresh list is returned each call since
+        callers pare their copies down as variables are handled.
+        """
+        cache_key = (id(subsys), io)
+        try:
+            return list(self._promset_cache[cache_key])
+        except KeyError:
+            pass
+
+        # only prom_name is used downstream, so skip pulling values out of the vectors
+        if io == 'input':
+            meta_dict = subsys.list_inputs(
+                return_format='dict', val=False, out_stream=None, all_procs=True
+            )
+        else:
+            meta_dict = subsys.list_outputs(
+                return_format='dict', val=False, residuals=False, out_stream=None,
+                all_procs=True,
+            )
+        prom_set = {
+            meta['prom_name']
+            for meta in meta_dict.values()
+            if '.' not in meta['prom_name']
+        }
+        self._promset_cache[cache_key] = prom_set
+
+        return list(prom_set)
+
     def configure(self):
         """
         Correctly connect variables between shaft power model, gearbox, and propeller,
@@ -389,7 +469,7 @@ class TurbopropMission(om.Group):
         # Don't promote inputs that are in this list - shaft power should be an output
         #   of this system, also having it as an input causes feedback loop problem at
         #   the propulsion level
-        skipped_inputs = [
+        skipped_inputs = {
             Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN,
             Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
             Dynamic.Vehicle.Propulsion.NOX_RATE,
@@ -398,7 +478,7 @@ class TurbopropMission(om.Group):
             Dynamic.Vehicle.Propulsion.TEMPERATURE_T4,
             Dynamic.Vehicle.Propulsion.THRUST,
             Dynamic.Vehicle.Propulsion.THRUST_MAX,
-        ]
+        }
 
         # Build lists of inputs/outputs for each component as needed:
         # "_input_list" or "_output_list" are all variables that still need to be
@@ -407,58 +487,24 @@ class TurbopropMission(om.Group):
         #   given component, which is done at the end as a bulk promote.
 
         shp_model = self._get_subsystem(self.options['shaft_power_model'].name)
-        shp_input_dict = shp_model.list_inputs(
-            return_format='dict', units=True, out_stream=None, all_procs=True
-        )
-        shp_input_list = list(
-            set(
-                shp_input_dict[key]['prom_name']
-                for key in shp_input_dict
-                if '.' not in shp_input_dict[key]['prom_name']
-            )
-        )
-        shp_output_dict = shp_model.list_outputs(
-            return_format='dict', units=True, out_stream=None, all_procs=True
-        )
-        shp_output_list = list(
-            set(
-                shp_output_dict[key]['prom_name']
-                for key in shp_output_dict
-                if '.' not in shp_output_dict[key]['prom_name']
-            )
-        )
+        shp_input_list = self._prom_list(shp_model, 'input')
+        shp_output_list = self._prom_list(shp_model, 'output')
         # always promote all shaft power model inputs w/o aliasing
         shp_inputs = ['*']
         shp_outputs = []
 
         if has_gearbox:
             gearbox_model = self._get_subsystem(self.options['gearbox_model'].name)
-            gearbox_input_dict = gearbox_model.list_inputs(
-                return_format='dict', units=True, out_stream=None, all_procs=True
-            )
             # Assumption is made that variables with '_out' should never be promoted or
             #   connected as top-level input to gearbox. This is necessary because
             #   Aviary gearbox uses things like shp_out internally, like when computing
             #   torque output, so "shp_out" is an input to that internal component
-            gearbox_input_list = list(
-                set(
-                    gearbox_input_dict[key]['prom_name']
-                    for key in gearbox_input_dict
-                    if '.' not in gearbox_input_dict[key]['prom_name']
-                    and '_out' not in gearbox_input_dict[key]['prom_name']
-                )
-            )
+            gearbox_input_list = [
+                var for var in self._prom_list(gearbox_model, 'input')
+                if '_out' not in var
+            ]
             gearbox_inputs = []
-            gearbox_output_dict = gearbox_model.list_outputs(
-                return_format='dict', units=True, out_stream=None, all_procs=True
-            )
-            gearbox_output_list = list(
-                set(
-                    gearbox_output_dict[key]['prom_name']
-                    for key in gearbox_output_dict
-                    if '.' not in gearbox_output_dict[key]['prom_name']
-                )
-            )
+            gearbox_output_list = self._prom_list(gearbox_model, 'output')
             gearbox_outputs = []
 
         if isinstance(self.options['propeller_model'], PropellerBuilder):
@@ -466,16 +512,7 @@ class TurbopropMission(om.Group):
         else:
             propeller_model_name = self.options['propeller_model'].name
         propeller_model = self._get_subsystem(propeller_model_name)
-        propeller_input_dict = propeller_model.list_inputs(
-            return_format='dict', units=True, out_stream=None, all_procs=True
-        )
-        propeller_input_list = list(
-            set(
-                propeller_input_dict[key]['prom_name']
-                for key in propeller_input_dict
-                if '.' not in propeller_input_dict[key]['prom_name']
-            )
-        )
+        propeller_input_list = self._prom_list(propeller_model, 'input')
         propeller_inputs = []
         # always promote all propeller model outputs w/o aliasing except thrust
         propeller_outputs = [
@@ -501,26 +538,33 @@ class TurbopropMission(om.Group):
 
         # Gearbox connections
         if has_gearbox:
-            for var in shp_output_list.copy():
-                # Check for case: var is output from shp_model, connects to gearbox, then
-                #   gets updated by gearbox
-                # RPM has special handling, so skip it here
-                if var + '_in' in gearbox_input_list and var != Dynamic.Vehicle.Propulsion.RPM:
-                    # if var is in gearbox input and output, connect on shp -> gearbox
-                    # side
-                    if (
-                        var in gearbox_output_list
-                        or var + '_out' in gearbox_output_list
-                    ):
-                        shp_outputs.append((var, var + '_gearbox'))
-                        shp_output_list.remove(var)
-                        gearbox_inputs.append((var + '_in', var + '_gearbox'))
-                        gearbox_input_list.remove(var + '_in')
-                    # otherwise it gets promoted, which will get done later
+            # Check for case: var is output from shp_model, connects to gearbox, then
+            #   gets updated by gearbox. Match shp outputs against the gearbox '_in'
+            #   aliases with set intersections rather than scanning the name lists for
+            #   every variable
+            # RPM has special handling, so skip it here
+            gearbox_in_map = {
+                var[:-3]: var for var in gearbox_input_list if var.endswith('_in')
+            }
+            gearbox_output_set = set(gearbox_output_list)
+            common = (set(shp_output_list) & gearbox_in_map.keys()) - {
+                Dynamic.Vehicle.Propulsion.RPM
+            }
+            for var in [var for var in shp_output_list if var in common]:
+                # if var is in gearbox input and output, connect on shp -> gearbox
+                # side
+                if var in gearbox_output_set or var + '_out' in gearbox_output_set:
+                    shp_outputs.append((var, var + '_gearbox'))
+                    shp_output_list.remove(var)
+                    gearbox_inputs.append((gearbox_in_map[var], var + '_gearbox'))
+                    gearbox_input_list.remove(gearbox_in_map[var])
+                # otherwise it gets promoted, which will get done later
 
         # If fixed RPM is requested by the user, use that value. Override RPM output
         #   from shaft power model if present, warning user
         rpm_ivc = self._get_subsystem('fixed_rpm_source')
+        rpm_in = Dynamic.Vehicle.Propulsion.RPM + '_in'
+        rpm_gearbox = Dynamic.Vehicle.Propulsion.RPM + '_gearbox'
 
         if Aircraft.Engine.FIXED_RPM in self.aviary_inputs:
             fixed_rpm = self.aviary_inputs.get_val(
@@ -540,16 +584,15 @@ class TurbopropMission(om.Group):
                      Dynamic.Vehicle.Propulsion.RPM))
                 shp_output_list.remove(Dynamic.Vehicle.Propulsion.RPM)
 
-            fixed_rpm_nn = np.ones(self.num_nodes) * fixed_rpm
+            fixed_rpm_nn = np.full(self.num_nodes, fixed_rpm)
 
             rpm_ivc.add_output(Dynamic.Vehicle.Propulsion.RPM, fixed_rpm_nn, units='rpm')
             if has_gearbox:
                 self.promotes(
                     'fixed_rpm_source', [
                         (Dynamic.Vehicle.Propulsion.RPM, 'fixed_rpm')])
-                gearbox_inputs.append(
-                    (Dynamic.Vehicle.Propulsion.RPM + '_in', 'fixed_rpm'))
-                gearbox_input_list.remove(Dynamic.Vehicle.Propulsion.RPM + '_in')
+                gearbox_inputs.append((rpm_in, 'fixed_rpm'))
+                gearbox_input_list.remove(rpm_in)
             else:
                 self.promotes('fixed_rpm_source', ['*'])
             # models such as motor take RPM as input
@@ -563,34 +606,34 @@ class TurbopropMission(om.Group):
                 units='rpm')
             if has_gearbox:
                 if Dynamic.Vehicle.Propulsion.RPM in shp_output_list:
-                    shp_outputs.append(
-                        (Dynamic.Vehicle.Propulsion.RPM,
-                         Dynamic.Vehicle.Propulsion.RPM + '_gearbox'))
+                    shp_outputs.append((Dynamic.Vehicle.Propulsion.RPM, rpm_gearbox))
                     shp_output_list.remove(Dynamic.Vehicle.Propulsion.RPM)
-                gearbox_inputs.append(
-                    (Dynamic.Vehicle.Propulsion.RPM + '_in',
-                     Dynamic.Vehicle.Propulsion.RPM + '_gearbox'))
-                gearbox_input_list.remove(Dynamic.Vehicle.Propulsion.RPM + '_in')
+                gearbox_inputs.append((rpm_in, rpm_gearbox))
+                gearbox_input_list.remove(rpm_in)
 
         # All other shp model outputs that don't interact with gearbox will be promoted
-        for var in shp_output_list:
-            shp_outputs.append(var)
+        shp_outputs.extend(shp_output_list)
 
         #############################
         # GEARBOX MODEL CONNECTIONS #
         #############################
         if has_gearbox:
             # Promote all inputs which don't come from shp model (those got connected),
-            #   don't promote ones in skip list
-            for var in gearbox_input_list.copy():
-                if var not in skipped_inputs:
-                    gearbox_inputs.append(var)
-                # DO NOT promote inputs in skip list - always skip
-                gearbox_input_list.remove(var)
-
-            # gearbox outputs can always get promoted
-            for var in propeller_input_list.copy():
-                if var in gearbox_output_list and var in propeller_input_list:
+            #   don't promote ones in skip list - DO NOT promote those, always skip
+            gearbox_inputs.extend(
+                var for var in gearbox_input_list if var not in skipped_inputs
+            )
+
+            # gearbox outputs can always get promoted - match them to propeller
+            #   inputs directly and through the '_out' aliases via set intersection
+            gearbox_out_map = {
+                var[:-4]: var for var in gearbox_output_list if var.endswith('_out')
+            }
+            propeller_input_set = set(propeller_input_list)
+            direct = set(gearbox_output_list) & propeller_input_set
+            aliased = gearbox_out_map.keys() & propeller_input_set
+            for var in propeller_input_list:
+                if var in direct:
                     gearbox_outputs.append((var, var))
                     gearbox_output_list.remove(var)
                     # connect variables in skip list to propeller
@@ -601,9 +644,9 @@ class TurbopropMission(om.Group):
                         )
 
                 # alias outputs with 'out' to match with propeller
-                if var + '_out' in gearbox_output_list and var in propeller_input_list:
-                    gearbox_outputs.append((var + '_out', var))
-                    gearbox_output_list.remove(var + '_out')
+                if var in aliased:
+                    gearbox_outputs.append((gearbox_out_map[var], var))
+                    gearbox_output_list.remove(gearbox_out_map[var])
                     # connect variables in skip list to propeller
                     if var in skipped_inputs:
                         self.connect(
@@ -611,20 +654,29 @@ class TurbopropMission(om.Group):
                             propeller_model.name + '.' + var,
                         )
 
-        # inputs/outputs that didn't need special handling will get promoted
-        for var in gearbox_input_list:
-            gearbox_inputs.append(var)
-        for var in gearbox_output_list:
-            gearbox_outputs.append(var)
+            # outputs that didn't need special handling will get promoted
+            gearbox_outputs.extend(gearbox_output_list)
 
         ###############################
         # PROPELLER MODEL CONNECTIONS #
         ###############################
         # we will promote all inputs not in skip list
-        for var in propeller_input_list.copy():
-            if var not in skipped_inputs:
-                propeller_inputs.append(var)
-            propeller_input_list.remove(var)
+        propeller_inputs.extend(
+            var for var in propeller_input_list if var not in skipped_inputs
+        )
+
+        if not has_gearbox:
+            # Without a gearbox the shaft power model drives the propeller directly.
+            #   Propeller inputs on the skip list are never promoted, so route them
+            #   from the promoted shp model outputs with explicit connections - the
+            #   same treatment the promoted gearbox outputs get above
+            shp_promoted = set(shp_output_list)
+            for var in propeller_input_list:
+                if var in skipped_inputs and var in shp_promoted:
+                    self.connect(
+                        var,
+                        propeller_model.name + '.' + var,
+                    )
 
         ##############
         # PROMOTIONS #
@@ -641,3 +693,59 @@ class TurbopropMission(om.Group):
         self.promotes(
             propeller_model_name, inputs=propeller_inputs, outputs=propeller_outputs
         )
+
+
+class ThrustAdder(om.ExplicitComponent):
+    """
+    Sums turboshaft tailpipe thrust and propeller thrust to get total turboprop thrust,
+    for both the operating and maximum thrust conditions.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            'num_nodes', types=int, desc='Number of nodes to be evaluated in the RHS'
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+
+        # default values are copied into the vectors, so one buffer can be shared
+        zeros = np.zeros(nn)
+        self.add_input('turboshaft_thrust', val=zeros, units='lbf')
+        self.add_input('propeller_thrust', val=zeros, units='lbf')
+        self.add_input('turboshaft_thrust_max', val=zeros, units='lbf')
+        self.add_input('propeller_thrust_max', val=zeros, units='lbf')
+
+        self.add_output('turboprop_thrust', val=zeros, units='lbf')
+        self.add_output('turboprop_thrust_max', val=zeros, units='lbf')
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+
+        # thrust is an elementwise sum, so the Jacobian is a constant sparse
+        # identity - OpenMDAO caches the declared value and never calls back
+        # into this component during linearization
+        arange = np.arange(nn)
+        ones = np.ones(nn)
+        self.declare_partials(
+            'turboprop_thrust',
+            ['turboshaft_thrust', 'propeller_thrust'],
+            val=ones,
+            rows=arange,
+            cols=arange,
+        )
+        self.declare_partials(
+            'turboprop_thrust_max',
+            ['turboshaft_thrust_max', 'propeller_thrust_max'],
+            val=ones,
+            rows=arange,
+            cols=arange,
+        )
+
+    def compute(self, inputs, outputs):
+        outputs['turboprop_thrust'] = (
+            inputs['turboshaft_thrust'] + inputs['propeller_thrust']
+        )
+        outputs['turboprop_thrust_max'] = (
+            inputs['turboshaft_thrust_max'] + inputs['propeller_thrust_max']
+        )
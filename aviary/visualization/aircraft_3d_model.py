@@ -215,6 +215,9 @@ class AircraftModelReader(object):
     ----------
     case_recorder_file : str
         Path to the case recorder file.
+    cr : CaseReader or None
+        Previously opened CaseReader for the case recorder file. If None, one is
+        opened when the file is read.
 
     Attributes
     ----------
@@ -228,9 +231,9 @@ class AircraftModelReader(object):
         Final Problem case from the case recorder file.
     """
 
-    def __init__(self, case_recorder_file):
+    def __init__(self, case_recorder_file, cr=None):
         self._case_recorder_file = case_recorder_file
-        self._cr = None
+        self._cr = cr
         self._problem_metadata = None
         self._final_case = None
 
@@ -243,8 +246,11 @@ class AircraftModelReader(object):
         case_recorder_file : str
             Path to the case recorder file.
         """
-        cr = om.CaseReader(self._case_recorder_file)
-        self._cr = cr
+        # opening a case recorder file parses the whole thing, so reuse a reader
+        #   if one was provided
+        if self._cr is None:
+            self._cr = om.CaseReader(self._case_recorder_file)
+        cr = self._cr
         self._problem_metadata = cr.problem_metadata
 
         model_options = cr.list_model_options(out_stream=None)
@@ -844,6 +850,9 @@ class Aircraft3DModel(object):
     ----------
     case_recorder_file : str
         Path to the case recorder file.
+    cr : CaseReader or None
+        Previously opened CaseReader for the case recorder file. If None, one is
+        opened when the file is read.
 
     Attributes
     ----------
@@ -855,8 +864,8 @@ class Aircraft3DModel(object):
         HTML representing all the camera in the scene.
     """
 
-    def __init__(self, case_recorder_file):
-        self._reader = AircraftModelReader(case_recorder_file)
+    def __init__(self, case_recorder_file, cr=None):
+        self._reader = AircraftModelReader(case_recorder_file, cr=cr)
         self._reader.read_case_recorder_file()
 
         # Used for debugging. Uncomment to print out the input and output variables
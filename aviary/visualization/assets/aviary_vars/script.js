@@ -8,7 +8,45 @@ $(function () {
   // Read in the json file that the dashboard.py script generated
   fetch('./aviary_vars.json')
     .then((response) => response.json())
-    .then((json) => createTabulator(json));
+    .then((json) => createTabulator(rowsFromJson(json)));
+
+  // Build one row object from the columnar arrays
+  function rowFromColumns(cols, i) {
+    var row = {
+      abs_name: cols.abs_name[i],
+      prom_name: cols.prom_name[i],
+      value: cols.value[i],
+      units: cols.units[i],
+    };
+    if (cols.metadata[i] !== null) {
+      row.metadata = cols.metadata[i];
+    }
+    return row;
+  }
+
+  // The json file stores the table as columns ({cols: ..., children: ...})
+  // to keep it small; rebuild the nested list of row objects that Tabulator
+  // expects. Older files that already hold the nested list are used as-is.
+  function rowsFromJson(json) {
+    if (Array.isArray(json)) {
+      return json;
+    }
+
+    var cols = json.cols;
+    var children = json.children;
+    var rows = [];
+    for (var i = 0; i < cols.abs_name.length; i++) {
+      var row = rowFromColumns(cols, i);
+      if (cols.child_start[i] >= 0) {
+        row._children = [];
+        for (var j = cols.child_start[i]; j < cols.child_end[i]; j++) {
+          row._children.push(rowFromColumns(children, j));
+        }
+      }
+      rows.push(row);
+    }
+    return rows;
+  }
 
   // Add event listener to the checkbox for showing only aviary variables
   document.getElementById('aviary-vars-filter').addEventListener('change', function () {
@@ -1,18 +1,28 @@
 import argparse
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+import functools
 import importlib.util
+from itertools import groupby
 import json
 import os
 import pathlib
 from pathlib import Path
 import re
 import shutil
+import sqlite3
 import warnings
 import zipfile
 
 import numpy as np
 
+try:
+    # orjson's C encoder is several times faster than the stdlib json encoder
+    import orjson
+except ImportError:
+    orjson = None
+
 import pandas as pd
 
 from bokeh.models import Legend, LegendItem, CheckboxGroup, CustomJS, TextInput, ColumnDataSource, CustomJS, Div, Range1d, LinearAxis, PrintfTickFormatter
@@ -32,6 +42,12 @@ except BaseException:
     def get_free_port():
         return 5000
 from openmdao.utils.om_warnings import issue_warning
+try:
+    from openmdao.utils.record_util import deserialize
+except ImportError:
+    # if the decoder isn't importable, driver iterations are read through
+    #  the regular per-case API
+    deserialize = None
 
 from dymos.visualization.timeseries.bokeh_timeseries_report import _meta_tree_subsys_iter
 
@@ -57,6 +73,18 @@ pn.extension('tabulator')
 aviary_variables_json_file_name = "aviary_vars.json"
 documentation_text_align = 'left'
 
+# attributes for the iframes that embed the HTML reports in the tabs
+iframe_css = 'width=1200px height=800px overflow-x="scroll" overflow="scroll" margin=0px padding=0px border=20px frameBorder=20px scrolling="yes"'
+
+# Location of the aviary package and the dashboard assets shipped with it.
+# find_spec walks sys.path, so resolve these once at import
+_AVIARY_DIR = Path(importlib.util.find_spec("aviary").origin).parent
+_ASSETS_DIR = _AVIARY_DIR / "visualization" / "assets"
+_AIRCRAFT_3D_TEMPLATE = _ASSETS_DIR / "aircraft_3d_file_template.html"
+_AIRLINES_PNG = _ASSETS_DIR / "aviary_airlines.png"
+_VARS_INDEX_HTML = _ASSETS_DIR / "aviary_vars" / "index.html"
+_VARS_SCRIPT_JS = _ASSETS_DIR / "aviary_vars" / "script.js"
+
 # functions for the aviary command line command
 
 
@@ -248,14 +276,12 @@ def create_table_pane_from_json(json_filepath, documentation):
                                               'Value': '',
                                           })
         table_pane_with_doc = pn.Column(
-            pn.pane.HTML(f"<p>{documentation}</p>",
-                         styles={'text-align': documentation_text_align}),
+            _doc_pane(documentation),
             table_pane
         )
     except Exception as err:
         table_pane_with_doc = pn.Column(
-            pn.pane.HTML(f"<p>{documentation}</p>",
-                         styles={'text-align': documentation_text_align}),
+            _doc_pane(documentation),
             pn.pane.Markdown(
                 f"# Table not shown because data source JSON file, '{json_filepath}', not found.")
         )
@@ -265,7 +291,43 @@ def create_table_pane_from_json(json_filepath, documentation):
 
 # functions for creating Panel Panes given different kinds of
 #    data inputs
-def create_csv_frame(csv_filepath, documentation):
+_DOC_STYLE = {'text-align': documentation_text_align}
+
+
+def _doc_pane(documentation):
+    """
+    Make the small HTML pane that shows a tab's documentation string.
+
+    Every tab carries one of these above its report; building them through
+    one factory keeps the markup and style in a single place.
+    """
+    return pn.pane.HTML(f"<p>{documentation}</p>", styles=_DOC_STYLE)
+
+
+def _report_exists(filepath, existing_names):
+    """
+    Check whether a report file exists, using a pre-scanned set of directory
+    entries when one is given instead of a per-file stat call.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the report file.
+    existing_names : set of str or None
+        Names of the files present in the reports directory, from a single
+        os.scandir pass. If None, the file system is checked directly.
+
+    Returns
+    -------
+    exists : bool
+        True if the report file exists.
+    """
+    if existing_names is not None:
+        return os.path.basename(filepath) in existing_names
+    return os.path.isfile(filepath)
+
+
+def create_csv_frame(csv_filepath, documentation, existing_names=None):
     """
     Create a Panel Pane that contains a tabular display of the data in a CSV file.
 
@@ -275,6 +337,9 @@ def create_csv_frame(csv_filepath, documentation):
         Path to the input CSV file.
     documentation : str
         Explanation of what this tab is showing.
+    existing_names : set of str or None
+        Names of the files present in the reports directory, used to skip the
+        per-file existence check. See _report_exists.
 
     Returns
     -------
@@ -282,8 +347,15 @@ def create_csv_frame(csv_filepath, documentation):
         A Panel Pane object showing the tabular display of the CSV file contents.
         Or None if the CSV file does not exist.
     """
-    if os.path.isfile(csv_filepath):
-        df = pd.read_csv(csv_filepath)
+    if _report_exists(csv_filepath, existing_names):
+        try:
+            # pyarrow's multi-threaded CSV parser is much faster than the
+            #  default C engine on numeric-heavy files like the mission
+            #  timeseries data
+            df = pd.read_csv(csv_filepath, engine="pyarrow")
+        except (ImportError, ValueError):
+            # pyarrow not installed or too old to be used as a pandas engine
+            df = pd.read_csv(csv_filepath)
         df_pane = pn.widgets.Tabulator(
             df,
             show_index=False,
@@ -293,14 +365,12 @@ def create_csv_frame(csv_filepath, documentation):
             sizing_mode='scale_both',
         )
         report_pane = pn.Column(
-            pn.pane.HTML(f"<p>{documentation}</p>",
-                         styles={'text-align': documentation_text_align}),
+            _doc_pane(documentation),
             df_pane
         )
     else:
         report_pane = pn.Column(
-            pn.pane.HTML(f"<p>{documentation}</p>",
-                         styles={'text-align': documentation_text_align}),
+            _doc_pane(documentation),
             pn.pane.Markdown(
                 f"# Report not shown because data source CSV file, '{csv_filepath}', not found.")
         )
@@ -324,7 +394,7 @@ def get_run_status(status_filepath):
         return 'Unknown'
 
 
-def create_report_frame(format, text_filepath, documentation):
+def create_report_frame(format, text_filepath, documentation, existing_names=None):
     """
     Create a Panel Pane that contains an embedded external file in HTML, Markdown, or text format,
     or a simple message in HTML format.
@@ -337,6 +407,9 @@ def create_report_frame(format, text_filepath, documentation):
         Path to the report text file or message if format is 'simple_message'.
     documentation : str
         Explanation of what this tab is showing.
+    existing_names : set of str or None
+        Names of the files present in the reports directory, used to skip the
+        per-file existence check. See _report_exists.
 
     Returns
     -------
@@ -346,41 +419,125 @@ def create_report_frame(format, text_filepath, documentation):
     """
     if format == "simple_message":
         report_pane = pn.Column(
-            pn.pane.HTML(f"<p>{documentation}</p>", styles={'text-align': 'left'}),
+            _doc_pane(documentation),
             pn.pane.HTML(f"<p>{text_filepath}</p>", styles={'text-align': 'left'})
         )
-    elif os.path.isfile(text_filepath):
+    elif _report_exists(text_filepath, existing_names):
         if format == "html":
-            iframe_css = 'width=1200px height=800px overflow-x="scroll" overflow="scroll" margin=0px padding=0px border=20px frameBorder=20px scrolling="yes"'
             report_pane = pn.Column(
-                pn.pane.HTML(f"<p>{documentation}</p>", styles={'text-align': 'left'}),
+                _doc_pane(documentation),
                 pn.pane.HTML(f"<iframe {iframe_css} src=/home/{text_filepath}></iframe>")
             )
         elif format in ["markdown", "text"]:
-            with open(text_filepath, "rb") as f:
-                file_text = f.read()
-                # need to deal with some encoding errors
-                file_text = file_text.decode("latin-1")
+            # need to deal with some encoding errors
+            file_text = Path(text_filepath).read_text(
+                encoding="latin-1", errors="replace")
             if format == "markdown":
                 report_pane = pn.pane.Markdown(file_text)
             elif format == "text":
                 report_pane = pn.pane.Str(file_text)
             report_pane = pn.Column(
-                pn.pane.HTML(f"<p>{documentation}</p>", styles={'text-align': 'left'}),
+                _doc_pane(documentation),
                 report_pane
             )
         else:
             raise RuntimeError(f"Report format of {format} is not supported.")
     else:
         report_pane = pn.Column(
-            pn.pane.HTML(f"<p>{documentation}</p>", styles={'text-align': 'left'}),
+            _doc_pane(documentation),
             pn.pane.Markdown(
                 f"# Report not shown because report file, '{text_filepath}', not found.")
         )
     return report_pane
 
 
-def create_aviary_variables_table_data_nested(script_name, recorder_file):
+def _resolve_tab_futures(tabs_list):
+    """
+    Replace any Future in a list of (label, pane) tabs with its finished pane.
+
+    The report frames are built in a thread pool so their file reads overlap;
+    this collects the results in the original tab order.
+    """
+    return [
+        (label, pane.result() if isinstance(pane, Future) else pane)
+        for label, pane in tabs_list
+    ]
+
+
+def _fast_value(val):
+    """
+    Convert an output value to a JSON-ready nested list.
+
+    Most values contain no NaN/Inf entries, so check for those with one
+    vectorized isfinite call and only fall back to the per-element sentinel
+    conversion when they are actually present.
+    """
+    val = np.asarray(val)
+    if np.issubdtype(val.dtype, np.floating) and not np.isfinite(val).all():
+        return convert_ndarray_to_support_nans_in_json(val)
+    return val.tolist()
+
+
+def _append_row(columns, name, outputs, abs_name=None):
+    """
+    Append one variable's fields to a set of aviary_vars column arrays.
+
+    abs_name overrides the name shown in the Absolute Name column; the value
+    is always looked up under name.
+    """
+    prom_name = outputs[name]["prom_name"]
+    columns["abs_name"].append(name if abs_name is None else abs_name)
+    columns["prom_name"].append(prom_name)
+    columns["value"].append(_fast_value(outputs[name]["val"]))
+    columns["units"].append(outputs[name]["units"])
+    columns["metadata"].append(_metadata_json(prom_name))
+
+
+@functools.lru_cache(maxsize=None)
+def _metadata_json(prom_name):
+    """
+    Serialize the Aviary metadata for a variable to JSON. Many variables share the
+    same promoted name across groups, so each unique name is encoded only once.
+    """
+    return json.dumps(av.CoreMetaData.get(prom_name))
+
+
+# case.list_outputs() walks every variable in the recorder file, so results are
+#  cached for reuse across dashboard panes, keyed by file path and modification time
+_case_outputs_cache = {}
+
+
+def _final_case_outputs(cr, recorder_file, **list_outputs_kwargs):
+    """
+    Get the outputs of the 'final' case in a case recorder file. Results are cached
+    so multiple dashboard panes reading the same file don't each re-walk every
+    variable.
+
+    Parameters
+    ----------
+    cr : CaseReader
+        Open CaseReader for the case recorder file.
+    recorder_file : str
+        Name of the case recorder file, used to key the cache.
+    **list_outputs_kwargs
+        Additional arguments passed on to Case.list_outputs.
+    """
+    cache_key = (
+        os.path.abspath(recorder_file),
+        os.path.getmtime(recorder_file),
+        tuple(sorted(list_outputs_kwargs.items())),
+    )
+    try:
+        return _case_outputs_cache[cache_key]
+    except KeyError:
+        outputs = cr.get_case("final").list_outputs(
+            out_stream=None, **list_outputs_kwargs
+        )
+        _case_outputs_cache[cache_key] = outputs
+        return outputs
+
+
+def create_aviary_variables_table_data_nested(script_name, recorder_file, cr=None):
     """
     Create a JSON file with information about Aviary variables.
 
@@ -396,97 +553,161 @@ def create_aviary_variables_table_data_nested(script_name, recorder_file):
     ----------
     recorder_file : str
         Name of the recorder file containing the Problem cases.
+    cr : CaseReader or None
+        Previously opened CaseReader for the recorder file. If None, one is opened.
 
     Returns
     -------
-    table_data_nested
-        A nested list of information about the Aviary variables.
+    table_data
+        A dict of column arrays describing the Aviary variables. The top-level
+        rows are in ``cols`` and the group children in ``children``; each
+        top-level row points at its children through ``child_start``/``child_end``
+        indices (-1 for a variable with no children). The rows are rebuilt
+        from the columns by script.js.
 
     """
-    cr = om.CaseReader(recorder_file)
+    if cr is None:
+        cr = om.CaseReader(recorder_file)
 
     if "final" not in cr.list_cases():
         return None
 
-    case = cr.get_case("final")
-    outputs = case.list_outputs(
+    # only prom_name, val, and units are read below, so don't ask
+    #  list_outputs to gather anything else
+    outputs = _final_case_outputs(
+        cr,
+        recorder_file,
         explicit=True,
         implicit=True,
         val=True,
-        residuals=False,
-        residuals_tol=None,
         units=True,
-        shape=False,
-        bounds=False,
-        desc=False,
-        scaling=False,
-        hierarchical=False,
-        print_arrays=False,
-        out_stream=None,
         return_format="dict",
     )
     sorted_abs_names = sorted(outputs.keys())
 
-    grouped = {}
-    for s in sorted_abs_names:
-        prefix = s.split(":")[0]
-        if prefix not in grouped:
-            grouped[prefix] = []
-        grouped[prefix].append(s)
-
-    sorted_group_names = sorted(grouped.keys())
-
-    table_data_nested = []
-    for group_name in sorted_group_names:
-        if len(grouped[group_name]) == 1:  # a list of one var.
-            var_info = grouped[group_name][0]
-            prom_name = outputs[var_info]["prom_name"]
-            aviary_metadata = av.CoreMetaData.get(prom_name)
-            table_data_nested.append(
-                {
-                    "abs_name": group_name,
-                    "prom_name": prom_name,
-                    "value": convert_ndarray_to_support_nans_in_json(
-                        outputs[var_info]["val"]
-                    ),
-                    "units": outputs[var_info]["units"],
-                    "metadata": json.dumps(aviary_metadata),
-                }
-            )
+    # The table is stored as columns rather than a list of per-row dicts:
+    # one set of flat arrays for the top-level rows and one for the group
+    # children, tied together by child index ranges. Repeating the five key
+    # strings once per variable roughly doubled the size of the JSON file;
+    # the columnar form writes and parses much faster and script.js rebuilds
+    # the nested rows with simple index arithmetic.
+    cols = {
+        "abs_name": [],
+        "prom_name": [],
+        "value": [],
+        "units": [],
+        "metadata": [],
+        "child_start": [],
+        "child_end": [],
+    }
+    children = {
+        "abs_name": [],
+        "prom_name": [],
+        "value": [],
+        "units": [],
+        "metadata": [],
+    }
+    # the names are sorted, so prefixes are contiguous - one groupby pass yields
+    #  the groups already in order, without building a dict of lists and
+    #  re-sorting its keys
+    for group_name, group_iter in groupby(
+        sorted_abs_names, key=lambda name: name.split(":", 1)[0]
+    ):
+        group_members = list(group_iter)
+        if len(group_members) == 1:  # a list of one var.
+            _append_row(cols, group_members[0], outputs, abs_name=group_name)
+            cols["child_start"].append(-1)
+            cols["child_end"].append(-1)
         else:
             # create children
-            children_list = []
-            for children_name in grouped[group_name]:
-                prom_name = outputs[children_name]["prom_name"]
-                aviary_metadata = av.CoreMetaData.get(prom_name)
-                children_list.append(
-                    {
-                        "abs_name": children_name,
-                        "prom_name": prom_name,
-                        "value": convert_ndarray_to_support_nans_in_json(
-                            outputs[children_name]["val"]
-                        ),
-                        "units": outputs[children_name]["units"],
-                        "metadata": json.dumps(aviary_metadata),
-                    }
-                )
-            table_data_nested.append(  # not a real var, just a group of vars so no values
-                {
-                    "abs_name": group_name,
-                    "prom_name": "",
-                    "value": "",
-                    "units": "",
-                    "_children": children_list,
-                }
-            )
+            child_start = len(children["abs_name"])
+            for children_name in group_members:
+                _append_row(children, children_name, outputs)
+            # not a real var, just a group of vars so no values
+            cols["abs_name"].append(group_name)
+            cols["prom_name"].append("")
+            cols["value"].append("")
+            cols["units"].append("")
+            cols["metadata"].append(None)
+            cols["child_start"].append(child_start)
+            cols["child_end"].append(len(children["abs_name"]))
+
+    table_data = {"cols": cols, "children": children}
 
     aviary_variables_file_path = (
         f"{script_name}_out/reports/aviary_vars/{aviary_variables_json_file_name}"
     )
+    if orjson is not None:
+        try:
+            Path(aviary_variables_file_path).write_bytes(
+                orjson.dumps(table_data, option=orjson.OPT_SERIALIZE_NUMPY)
+            )
+            return table_data
+        except TypeError:
+            # fall back to the stdlib encoder for anything orjson can't serialize
+            pass
     with open(aviary_variables_file_path, "w") as fp:
-        json.dump(table_data_nested, fp)
+        json.dump(table_data, fp)
+
+    return table_data
+
+
+def _load_driver_iteration_outputs(cr, recorder_file_name, num_cases):
+    """
+    Read the outputs of every driver iteration in one query against the case
+    recorder's SQLite table.
+
+    Outputs are stored as JSON text in recorder format version 3 and later;
+    they are decoded here with OpenMDAO's own deserialize, using the variable
+    metadata the reader has already parsed.
+
+    Parameters
+    ----------
+    cr : CaseReader
+        Open CaseReader for the recorder file, supplying the variable metadata
+        the decoder needs.
+    recorder_file_name : str
+        Name of the case recorder file.
+    num_cases : int
+        Number of driver cases the file is expected to hold.
 
-    return table_data_nested
+    Returns
+    -------
+    outputs : list or None
+        One record of output values per driver iteration, in iteration order
+        (structured arrays or dicts, as returned by deserialize). None if the
+        table cannot be read this way (e.g. a pre-JSON format version), in
+        which case the caller should use the per-case API.
+    """
+    if deserialize is None:
+        return None
+    try:
+        abs2meta = cr._abs2meta
+        prom2abs = cr._prom2abs
+        conns = cr._conns
+        format_version = cr._format_version
+    except AttributeError:
+        return None
+    if format_version < 3:
+        # these very old files store outputs as pickled arrays instead of
+        #  JSON; not worth a second decode path
+        return None
+    try:
+        conn = sqlite3.connect(f"file:{recorder_file_name}?mode=ro", uri=True)
+        try:
+            rows = conn.execute(
+                "SELECT counter, outputs FROM driver_iterations ORDER BY counter"
+            ).fetchall()
+        finally:
+            conn.close()
+        outputs = [
+            deserialize(blob, abs2meta, prom2abs, conns) for _counter, blob in rows
+        ]
+    except Exception:
+        return None
+    if len(outputs) != num_cases or any(out is None for out in outputs):
+        return None
+    return outputs
 
 
 def convert_driver_case_recorder_file_to_df(recorder_file_name):
@@ -501,66 +722,131 @@ def convert_driver_case_recorder_file_to_df(recorder_file_name):
     cr = om.CaseReader(recorder_file_name)
     driver_cases = cr.list_cases("driver", out_stream=None)
 
-    df = None
-    for i, case in enumerate(driver_cases):
-        driver_case = cr.get_case(case)
-
-        desvars = driver_case.get_design_vars(scaled=False)
-        objectives = driver_case.get_objectives(scaled=False)
-        constraints = driver_case.get_constraints(scaled=False)
-
-        if i == 0:  # Only need to get header of the data frame once
-            # Need to worry about the fact that a variable can be in more than one of
-            #  desvars, cons, and obj. So filter out the dupes
-            initial_desvars_names = list(desvars.keys())
-            initial_constraints_names = list(constraints.keys())
-            objectives_names = list(objectives.keys())
-
-            # Start with obj, then cons, then desvars
-            # Give priority to having a duplicate being in the obj and cons
-            #  over being in the desvars
-            all_var_names = objectives_names.copy()
-            constraints_names = []
-            for name in initial_constraints_names:
-                if name not in all_var_names:
-                    constraints_names.append(name)
-                    all_var_names.append(name)
-            desvars_names = []
-            for name in initial_desvars_names:
-                if name not in all_var_names:
-                    desvars_names.append(name)
-                    all_var_names.append(name)
-            header = ["iter_count"] + all_var_names
-            df = pd.DataFrame(columns=header)
-
-        # Now fill up a row
-        row = [
-            i,
-        ]
-        # important to do in this order since that is the order added to the header
-        for varname in objectives_names:
-            value = objectives[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-
-        for varname in constraints_names:
-            value = constraints[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-
-        for varname in desvars_names:
-            value = desvars[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-        df.loc[i] = row
+    if not driver_cases:
+        return None
+
+    # Only need to get the header once, from the first case.
+    # Need to worry about the fact that a variable can be in more than one of
+    #  desvars, cons, and obj. So filter out the dupes
+    first_case = cr.get_case(driver_cases[0])
+    first_objectives = first_case.get_objectives(scaled=False)
+    first_constraints = first_case.get_constraints(scaled=False)
+    first_desvars = first_case.get_design_vars(scaled=False)
+    objectives_names = list(first_objectives.keys())
+    initial_constraints_names = list(first_constraints.keys())
+    initial_desvars_names = list(first_desvars.keys())
+
+    # Start with obj, then cons, then desvars
+    # Give priority to having a duplicate being in the obj and cons
+    #  over being in the desvars
+    all_var_names = objectives_names.copy()
+    constraints_names = []
+    for name in initial_constraints_names:
+        if name not in all_var_names:
+            constraints_names.append(name)
+            all_var_names.append(name)
+    desvars_names = []
+    for name in initial_desvars_names:
+        if name not in all_var_names:
+            desvars_names.append(name)
+            all_var_names.append(name)
+
+    # Read every iteration's outputs in one sequential pass over the SQLite
+    #  table when possible - cr.get_case makes a round-trip and rebuilds a
+    #  Case wrapper per iteration, which dominates for runs with thousands
+    #  of iterations
+    case_values = None
+    iteration_outputs = _load_driver_iteration_outputs(
+        cr, recorder_file_name, len(driver_cases))
+    if iteration_outputs is not None:
+        first = iteration_outputs[0]
+        if isinstance(first, np.ndarray):
+            fields = set(first.dtype.names or ())
+        else:
+            fields = set(first)
+        # Resolve each header name to its recorded source and driver indices -
+        #  the same source/indices mapping Case.get_design_vars and friends
+        #  apply when returning unscaled values
+        var_info = getattr(cr, "_var_info", None) or {}
+        col_meta = {}
+        for varname in all_var_names:
+            meta = var_info.get(varname)
+            if meta is None or meta.get("source") not in fields:
+                col_meta = None
+                break
+            col_meta[varname] = (meta["source"], meta.get("indices"))
+        if col_meta is not None:
+            case_values = [
+                {
+                    varname: np.ravel(outputs[source])
+                    if indices is None
+                    else np.ravel(outputs[source])[indices]
+                    for varname, (source, indices) in col_meta.items()
+                }
+                for outputs in iteration_outputs
+            ]
+        # else a variable isn't stored under a source that can be resolved;
+        #  use the per-case API instead
+
+    if case_values is None:
+        case_values = []
+        for driver_case in (cr.get_case(case) for case in driver_cases):
+            values = dict(driver_case.get_design_vars(scaled=False))
+            values.update(driver_case.get_constraints(scaled=False))
+            values.update(driver_case.get_objectives(scaled=False))
+            case_values.append(values)
+
+    # Fill the preallocated buffer one column at a time: a single norm over
+    #  the stacked cases per variable instead of one Python-level call per
+    #  (case, variable) pair
+    data = np.empty((len(driver_cases), len(all_var_names)))
+    for j, varname in enumerate(all_var_names):
+        stack = np.array(
+            [np.ravel(values[varname]) for values in case_values]
+        )
+        if stack.shape[1] == 1:
+            # scalar variable: pass the values through, keeping their sign
+            data[:, j] = stack[:, 0]
+        else:
+            data[:, j] = np.linalg.norm(stack, axis=1)
+
+    df = pd.DataFrame(data, columns=all_var_names)
+    df.insert(0, "iter_count", np.arange(len(driver_cases)))
 
     return df
 
 
-def create_aircraft_3d_file(recorder_file, reports_dir, outfilepath):
+def _copy_if_stale(src, dst):
+    """
+    Copy the file src to dst, but only if dst does not already match src.
+
+    The dashboard re-copies its static assets on every run; skipping the
+    up-to-date ones avoids the redundant reads and writes on warm starts.
+    The mtime comparison alone is not trusted: pip-installed assets carry
+    the wheel's build timestamps, which can predate a copy made from an
+    older release, so the sizes must match as well before the copy is
+    skipped.
+
+    Parameters
+    ----------
+    src : str or Path
+        Path of the asset file shipped with aviary.
+    dst : str or Path
+        Path the asset should be copied to.
+    """
+    src = Path(src)
+    dst = Path(dst)
+    if dst.exists():
+        src_stat = src.stat()
+        dst_stat = dst.stat()
+        if (dst_stat.st_size == src_stat.st_size
+                and dst_stat.st_mtime >= src_stat.st_mtime):
+            return
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy(src, dst)
+
+
+def create_aircraft_3d_file(recorder_file, reports_dir, outfilepath, cr=None):
     """
     Create the HTML file with the display of the aircraft design
     in 3D using the A-Frame library.
@@ -573,25 +859,21 @@ def create_aircraft_3d_file(recorder_file, reports_dir, outfilepath):
         Path of the directory containing the reports from the run.
     outfilepath : str
         The path to the location where the file should be created.
+    cr : CaseReader or None
+        Previously opened CaseReader for the recorder file. If None, one is opened.
     """
-    # Get the location of the HTML template file for this HTML file
-    aviary_dir = Path(importlib.util.find_spec("aviary").origin).parent
-    aircraft_3d_template_filepath = aviary_dir.joinpath(
-        "visualization/assets/aircraft_3d_file_template.html"
-    )
-
     # texture for the aircraft. Need to copy it to the reports directory
     #  next to the HTML file
-    shutil.copy(
-        aviary_dir.joinpath("visualization/assets/aviary_airlines.png"),
+    _copy_if_stale(
+        _AIRLINES_PNG,
         Path(reports_dir) / "aviary_airlines.png",
     )
 
-    aircraft_3d_model = Aircraft3DModel(recorder_file)
+    aircraft_3d_model = Aircraft3DModel(recorder_file, cr=cr)
     aircraft_3d_model.read_variables()
     aircraft_3d_model.get_aframe_markup()
     aircraft_3d_model.get_camera_entity(aircraft_3d_model.fuselage.length)
-    aircraft_3d_model.write_file(aircraft_3d_template_filepath, outfilepath)
+    aircraft_3d_model.write_file(_AIRCRAFT_3D_TEMPLATE, outfilepath)
 
 
 def _get_interactive_plot_sources(
@@ -838,12 +1120,28 @@ def dashboard(script_name, problem_recorder, driver_recorder,
         issue_warning(
             f"Given Problem case recorder file {problem_recorder_path} does not exist.")
 
+    # The report frames are independent, I/O-bound builds (file checks plus
+    #  reads), so submit them to a thread pool to let the disk reads overlap.
+    #  The futures are swapped for their panes just before the tabs are made.
+    frame_pool = ThreadPoolExecutor(max_workers=8)
+
+    # One scandir pass replaces the per-report stat calls for the files the
+    #  tabs embed; everything checked against this set sits directly in
+    #  reports_dir
+    if os.path.isdir(reports_dir):
+        present_reports = {
+            entry.name for entry in os.scandir(reports_dir) if entry.is_file()
+        }
+    else:
+        present_reports = set()
+
     # TODO - use lists and functions to do this with a lot less code
     ####### Model Tab #######
     model_tabs_list = []
 
     #  Debug Input List
-    input_list_pane = create_report_frame(
+    input_list_pane = frame_pool.submit(
+        create_report_frame,
         "text", Path(reports_dir) / "input_list.txt", '''
        A plain text display of the model inputs. Recommended for beginners. Only created if Settings.VERBOSITY is set to at least 2 in the input deck.
         The variables are listed in a tree structure. There are three columns. The left column is a list of variable names,
@@ -851,11 +1149,12 @@ def dashboard(script_name, problem_recorder, driver_recorder,
         promoted variable name. The hierarchy is phase, subgroups, components, and variables. An input variable can appear under
         different phases and within different components. Its values can be different because its value has
         been updated during the computation. On the top-left corner is the total number of inputs.
-        That number counts the duplicates because one variable can appear in different phases.''')
+        That number counts the duplicates because one variable can appear in different phases.''', existing_names=present_reports)
     model_tabs_list.append(("Debug Input List", input_list_pane))
 
     #  Debug Output List
-    output_list_pane = create_report_frame(
+    output_list_pane = frame_pool.submit(
+        create_report_frame,
         "text", Path(reports_dir) / "output_list.txt", '''
        A plain text display of the model outputs. Recommended for beginners. Only created if Settings.VERBOSITY is set to at least 2 in the input deck.
         The variables are listed in a tree structure. There are three columns. The left column is a list of variable names,
@@ -863,43 +1162,50 @@ def dashboard(script_name, problem_recorder, driver_recorder,
         promoted variable name. The hierarchy is phase, subgroups, components, and variables. An output variable can appear under
         different phases and within different components. Its values can be different because its value has
         been updated during the computation. On the top-left corner is the total number of outputs.
-        That number counts the duplicates because one variable can appear in different phases.''')
+        That number counts the duplicates because one variable can appear in different phases.''', existing_names=present_reports)
     model_tabs_list.append(("Debug Output List", output_list_pane))
 
     # Inputs
-    inputs_pane = create_report_frame(
+    inputs_pane = frame_pool.submit(
+        create_report_frame,
         "html",
         Path(reports_dir) / "inputs.html",
-        "Detailed report on the model inputs.")
+        "Detailed report on the model inputs.", existing_names=present_reports)
     model_tabs_list.append(("Inputs", inputs_pane))
 
     # N2
-    n2_pane = create_report_frame("html", Path(reports_dir) / "n2.html", '''
+    n2_pane = frame_pool.submit(
+        create_report_frame,
+        "html", Path(reports_dir) / "n2.html", '''
         The N2 diagram, sometimes referred to as an eXtended Design Structure Matrix (XDSM), is a
         powerful tool for understanding your model in OpenMDAO. It is an N-squared diagram in the
         shape of a matrix representing functional or physical interfaces between system elements.
         It can be used to systematically identify, define, tabulate, design, and analyze functional
-        and physical interfaces.''')
+        and physical interfaces.''', existing_names=present_reports)
     model_tabs_list.append(("N2", n2_pane))
 
     # Trajectory Linkage
-    traj_linkage_report_pane = create_report_frame(
+    traj_linkage_report_pane = frame_pool.submit(
+        create_report_frame,
         "html", Path(reports_dir) / "traj_linkage_report.html", '''
         This is a Dymos linkage report in a customized N2 diagram. It provides a report detailing how phases
         are linked together via constraint or connection. The diagram clearly shows how mission phases are linked.
         It can be used to identify errant linkages between fixed quantities.
-        '''
+        ''',
+        existing_names=present_reports,
     )
     model_tabs_list.append(("Trajectory Linkage", traj_linkage_report_pane))
 
     # Driver scaling
-    driver_scaling_report_pane = create_report_frame(
+    driver_scaling_report_pane = frame_pool.submit(
+        create_report_frame,
         "html", Path(reports_dir) / "driver_scaling_report.html", '''
             This report is a summary of driver scaling information. After all design variables, objectives, and constraints
             are declared and the problem has been set up, this report presents all the design variables and constraints
             in all phases as well as the objectives. It also shows Jacobian information showing responses with respect to
             design variables (DV).
-        '''
+        ''',
+        existing_names=present_reports,
     )
     model_tabs_list.append(("Driver Scaling", driver_scaling_report_pane))
 
@@ -915,60 +1221,75 @@ def dashboard(script_name, problem_recorder, driver_recorder,
             optimization_tabs_list.append(("Optimization History", opt_history_pane))
 
     # IPOPT report
-    if os.path.isfile(Path(reports_dir) / "IPOPT.out"):
-        ipopt_pane = create_report_frame("text", Path(reports_dir) / "IPOPT.out", '''
+    if "IPOPT.out" in present_reports:
+        ipopt_pane = frame_pool.submit(
+            create_report_frame,
+            "text", Path(reports_dir) / "IPOPT.out", '''
             This report is generated by the IPOPT optimizer.
-                                        ''')
+                                        ''', existing_names=present_reports)
         optimization_tabs_list.append(("IPOPT Output", ipopt_pane))
 
     # Optimization report
-    opt_report_pane = create_report_frame(
+    opt_report_pane = frame_pool.submit(
+        create_report_frame,
         "html", Path(reports_dir) / "opt_report.html", '''
         This report is an OpenMDAO optimization report. All values are in unscaled, physical units.
         On the top is a summary of the optimization, followed by the objective, design variables, constraints,
-        and optimizer settings. This report is important when dissecting optimal results produced by Aviary.''')
+        and optimizer settings. This report is important when dissecting optimal results produced by Aviary.''', existing_names=present_reports)
     optimization_tabs_list.append(("Summary", opt_report_pane))
 
     # PyOpt report
-    if os.path.isfile(Path(reports_dir) / "pyopt_solution.out"):
-        pyopt_solution_pane = create_report_frame(
+    if "pyopt_solution.out" in present_reports:
+        pyopt_solution_pane = frame_pool.submit(
+            create_report_frame,
             "text", Path(reports_dir) / "pyopt_solution.txt", '''
             This report is generated by the pyOptSparse optimizer.
-        '''
+        ''',
+            existing_names=present_reports,
         )
         optimization_tabs_list.append(("PyOpt Solution", pyopt_solution_pane))
 
     # SNOPT report
-    if os.path.isfile(Path(reports_dir) / "SNOPT_print.out"):
-        snopt_pane = create_report_frame(
+    if "SNOPT_print.out" in present_reports:
+        snopt_pane = frame_pool.submit(
+            create_report_frame,
             "text", Path(reports_dir) / "SNOPT_print.out", '''
             This report is generated by the SNOPT optimizer.
-                                        ''')
+                                        ''', existing_names=present_reports)
         optimization_tabs_list.append(("SNOPT Output", snopt_pane))
 
     # SNOPT summary
-    if os.path.isfile(Path(reports_dir) / "SNOPT_summary.out"):
-        snopt_summary_pane = create_report_frame(
+    if "SNOPT_summary.out" in present_reports:
+        snopt_summary_pane = frame_pool.submit(
+            create_report_frame,
             "text", Path(reports_dir) / "SNOPT_summary.out", '''
-            This is a report generated by the SNOPT optimizer that summarizes the optimization results.''')
+            This is a report generated by the SNOPT optimizer that summarizes the optimization results.''', existing_names=present_reports)
         optimization_tabs_list.append(("SNOPT Summary", snopt_summary_pane))
 
     # Coloring report
-    coloring_report_pane = create_report_frame(
+    coloring_report_pane = frame_pool.submit(
+        create_report_frame,
         "html", Path(reports_dir) / "total_coloring.html",
-        "The report shows metadata associated with the creation of the coloring.")
+        "The report shows metadata associated with the creation of the coloring.", existing_names=present_reports)
     optimization_tabs_list.append(("Total Coloring", coloring_report_pane))
 
     ####### Results Tab #######
     results_tabs_list = []
 
+    # The problem recorder is read by several panes. om.CaseReader parses the whole
+    #  file on each open, so open it once here and share the reader
+    problem_cr = None
+    if problem_recorder_path and os.path.isfile(problem_recorder_path):
+        problem_cr = om.CaseReader(problem_recorder_path)
+
     # Aircraft 3d model display
     if problem_recorder_path:
         if os.path.isfile(problem_recorder_path):
             try:
                 aircraft_3d_file = Path(reports_dir) / "aircraft_3d.html"
                 create_aircraft_3d_file(
-                    problem_recorder_path, reports_dir, aircraft_3d_file
+                    problem_recorder_path, reports_dir, aircraft_3d_file,
+                    cr=problem_cr,
                 )
                 aircraft_3d_pane = create_report_frame(
                     "html", aircraft_3d_file,
@@ -988,24 +1309,19 @@ def dashboard(script_name, problem_recorder, driver_recorder,
         aviary_vars_dir = Path(reports_dir) / "aviary_vars"
         aviary_vars_dir.mkdir(parents=True, exist_ok=True)
 
-        # copy index.html file to reports/script_name/aviary_vars/index.html
-        aviary_dir = Path(importlib.util.find_spec("aviary").origin).parent
-
-        shutil.copy(
-            aviary_dir.joinpath("visualization/assets/aviary_vars/index.html"),
-            aviary_vars_dir.joinpath("index.html"),
-        )
-        shutil.copy(
-            aviary_dir.joinpath("visualization/assets/aviary_vars/script.js"),
-            aviary_vars_dir.joinpath("script.js"),
-        )
+        # copy index.html file to reports/script_name/aviary_vars/index.html.
+        # These two assets are copied unconditionally: script.js must always
+        #  match the aviary_vars.json layout written below, and both files are
+        #  small enough that skipping the copy saves nothing worthwhile
+        shutil.copy(_VARS_INDEX_HTML, aviary_vars_dir.joinpath("index.html"))
+        shutil.copy(_VARS_SCRIPT_JS, aviary_vars_dir.joinpath("script.js"))
         # copy script.js file to reports/script_name/aviary_vars/index.html.
         # mod the script.js file to point at the json file
         # create the json file and put it in
         # reports/script_name/aviary_vars/aviary_vars.json
         try:
             create_aviary_variables_table_data_nested(
-                script_name, problem_recorder_path
+                script_name, problem_recorder_path, cr=problem_cr
             )  # create the json file
 
             aviary_vars_pane = create_report_frame(
@@ -1018,9 +1334,10 @@ def dashboard(script_name, problem_recorder, driver_recorder,
                 f'Unable to create Aviary Variables tab in dashboard due to the error: {e}')
 
     # Mission Summary
-    mission_summary_pane = create_report_frame(
+    mission_summary_pane = frame_pool.submit(
+        create_report_frame,
         "markdown", Path(reports_dir) / "mission_summary.md",
-        "A report of mission results from an Aviary problem")
+        "A report of mission results from an Aviary problem", existing_names=present_reports)
     results_tabs_list.append(("Mission Summary", mission_summary_pane))
 
     # Run status pane
@@ -1031,18 +1348,20 @@ def dashboard(script_name, problem_recorder, driver_recorder,
     run_status_pane_tab_number = len(results_tabs_list) - 1
 
     # Timeseries Mission Output Report
-    mission_timeseries_pane = create_csv_frame(
+    mission_timeseries_pane = frame_pool.submit(
+        create_csv_frame,
         Path(reports_dir) / "mission_timeseries_data.csv", '''
         The outputs of the aircraft trajectory.
         Any value that is included in the timeseries data is included in this report.
         This data is useful for post-processing, especially those used for acoustic analysis.
-        ''')
+        ''', existing_names=present_reports)
     results_tabs_list.append(
         ("Timeseries Mission Output", mission_timeseries_pane)
     )
 
     # Trajectory results
-    traj_results_report_pane = create_report_frame(
+    traj_results_report_pane = frame_pool.submit(
+        create_report_frame,
         "html", Path(reports_dir) / "traj_results_report.html", '''
             This is one of the most important reports produced by Aviary. It will help you visualize and
             understand the optimal trajectory produced by Aviary.
@@ -1051,7 +1370,8 @@ def dashboard(script_name, problem_recorder, driver_recorder,
             On the timeseries tab, users can select which phases to view.
             Other features include hovering the mouse over the solution points to see solution value and
             zooming into a particular region for details, etc.
-        '''
+        ''',
+        existing_names=present_reports,
     )
     results_tabs_list.append(
         ("Trajectory Results", traj_results_report_pane)
@@ -1059,8 +1379,8 @@ def dashboard(script_name, problem_recorder, driver_recorder,
 
     # Interactive XY plot of mission variables
     if problem_recorder_path:
-        if os.path.exists(problem_recorder_path):
-            cr = om.CaseReader(problem_recorder_path)
+        if os.path.isfile(problem_recorder_path):
+            cr = problem_cr
 
             # determine what trajectories there are
             traj_nodes = [
@@ -1078,7 +1398,7 @@ def dashboard(script_name, problem_recorder, driver_recorder,
                 issue_warning("More than one trajectory found in problem case recorder file. Only using "
                               f'the first one, "{traj_name}", for the interactive XY plot of mission variables')
             case = cr.get_case("final")
-            outputs = case.list_outputs(out_stream=None, units=True)
+            outputs = _final_case_outputs(cr, problem_recorder_path, units=True)
 
             # data_by_varname_and_phase = defaultdict(dict)
             data_by_varname_and_phase = defaultdict(lambda: defaultdict(list))
@@ -1205,10 +1525,8 @@ def dashboard(script_name, problem_recorder, driver_recorder,
                 f"# Recorder file '{problem_recorder_path}' not found.")
 
         interactive_mission_var_plot_pane_with_doc = pn.Column(
-            pn.pane.HTML(
-                f"<p>Plot of mission variables allowing user to select X and Y plot values.</p>",
-                styles={
-                    'text-align': documentation_text_align}),
+            _doc_pane(
+                "Plot of mission variables allowing user to select X and Y plot values."),
             interactive_mission_var_plot_pane)
         results_tabs_list.append(
             ("Interactive Mission Variable Plot",
@@ -1221,8 +1539,20 @@ def dashboard(script_name, problem_recorder, driver_recorder,
     # The subsystems report tab shows selected results for every major
     # subsystem in the Aviary problem
 
-    for md_file in sorted(Path(f"{reports_dir}subsystems").glob("*.md"), key=str):
-        subsystems_pane = create_report_frame(
+    subsystems_dir = f"{reports_dir}subsystems"
+    if os.path.isdir(subsystems_dir):
+        # one scandir pass instead of a glob's per-entry stat calls
+        subsystem_md_files = sorted(
+            (Path(entry.path) for entry in os.scandir(subsystems_dir)
+             if entry.name.endswith(".md") and entry.is_file()),
+            key=str,
+        )
+    else:
+        subsystem_md_files = []
+
+    for md_file in subsystem_md_files:
+        subsystems_pane = frame_pool.submit(
+            create_report_frame,
             "markdown", str(md_file),
             f'''
 
@@ -1233,18 +1563,31 @@ def dashboard(script_name, problem_recorder, driver_recorder,
             ''')
         subsystem_tabs_list.append((md_file.stem, subsystems_pane))
 
-    # Actually make the tabs from the list of Panes
-    model_tabs = pn.Tabs(*model_tabs_list, stylesheets=["assets/aviary_styles.css"])
+    # Wait for the pooled report frames and swap each Future for its pane
+    frame_pool.shutdown(wait=True)
+    model_tabs_list = _resolve_tab_futures(model_tabs_list)
+    optimization_tabs_list = _resolve_tab_futures(optimization_tabs_list)
+    results_tabs_list = _resolve_tab_futures(results_tabs_list)
+    subsystem_tabs_list = _resolve_tab_futures(subsystem_tabs_list)
+
+    # Actually make the tabs from the list of Panes. dynamic=True renders
+    #  only the active tab in the browser; the others are sent over on first
+    #  activation, which keeps the initial page load to just the visible tab
+    model_tabs = pn.Tabs(
+        *model_tabs_list, dynamic=True, stylesheets=["assets/aviary_styles.css"]
+    )
     optimization_tabs = pn.Tabs(
-        *optimization_tabs_list, stylesheets=["assets/aviary_styles.css"]
+        *optimization_tabs_list, dynamic=True, stylesheets=["assets/aviary_styles.css"]
+    )
+    results_tabs = pn.Tabs(
+        *results_tabs_list, dynamic=True, stylesheets=["assets/aviary_styles.css"]
     )
-    results_tabs = pn.Tabs(*results_tabs_list, stylesheets=["assets/aviary_styles.css"])
     if run_status_pane_tab_number:
         # make the run status tab active initially
         results_tabs.active = run_status_pane_tab_number
     if subsystem_tabs_list:
         subsystem_tabs = pn.Tabs(
-            *subsystem_tabs_list, stylesheets=["assets/aviary_styles.css"]
+            *subsystem_tabs_list, dynamic=True, stylesheets=["assets/aviary_styles.css"]
         )
 
     # Add subtabs to tabs
@@ -1254,7 +1597,9 @@ def dashboard(script_name, problem_recorder, driver_recorder,
         high_level_tabs.append(("Subsystems", subsystem_tabs))
     high_level_tabs.append(("Model", model_tabs))
     high_level_tabs.append(("Optimization", optimization_tabs))
-    tabs = pn.Tabs(*high_level_tabs, stylesheets=["assets/aviary_styles.css"])
+    tabs = pn.Tabs(
+        *high_level_tabs, dynamic=True, stylesheets=["assets/aviary_styles.css"]
+    )
 
     save_dashboard_button = pn.widgets.Button(
         name="Save Dashboard",
@@ -1303,9 +1648,7 @@ def dashboard(script_name, problem_recorder, driver_recorder,
     if run_in_background:
         show = False
 
-    assets_dir = Path(
-        importlib.util.find_spec("aviary").origin
-    ).parent.joinpath("visualization/assets/")
+    assets_dir = _ASSETS_DIR
     home_dir = "."
     if port == 0:
         port = get_free_port()